@@ -17,14 +17,38 @@ Measurement tuple used throughout:
 """
 
 from pathlib import Path
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from itertools import chain
+from typing import DefaultDict, Dict, Iterator, List, Tuple
+import argparse
 import csv
+import mmap
+import pickle
+import re
+import sys
+from sys import intern
 
 # ---------- Paths ----------
 # We use Pathlib for clean and OS-independent file path handling.
 HERE = Path(__file__).resolve().parent
 AIR_QUALITY_FILE = HERE / "air_quality.csv"
 UHF_FILE = HERE / "uhf.csv"
+# Parsed indexes are pickled here so later runs can skip re-reading the CSVs.
+CACHE_FILE = HERE / ".cache.pkl"
+
+# Both files are comma-delimited; pass sniff=True (or --sniff) for other exports.
+AIR_QUALITY_DELIM = ","
+UHF_DELIM = ","
+
+# Leading 5-digit ZIP (ASCII digits only), compiled once for the UHF loader.
+_ZIP_MATCH = re.compile(r"[0-9]{5}").match
+
+# A '\r' not followed by '\n' ends a line for csv.reader but not for readline().
+_BARE_CR_SEARCH = re.compile(rb"\r(?!\n)").search
+
+# Python caps how many digits int() will parse from a string (4300 by
+# default, 0 = no cap); older versions without the cap report 0 here.
+_int_max_str_digits = getattr(sys, "get_int_max_str_digits", lambda: 0)
 
 # A measurement tuple stores the relevant info for each reading.
 Measurement = Tuple[str, int, str, float]
@@ -39,20 +63,31 @@ def _to_int_safe(x):
     This helper ensures that values like ' 42 ', '042', or even numeric strings
     from CSVs can be converted cleanly. 
     """
-    try:
-        return int(str(x).strip())
-    except Exception:
-        return None
-
-def _to_float_safe(x):
-    """Convert any value to float safely, returning None if it fails.
-    This helper behaves similarly to _to_int_safe but for floating-point values.
-    It is useful when reading numerical data from CSV files that may contain
-    missing, corrupted, or placeholder entries."""
-    try:
-        return float(str(x).strip())
-    except Exception:
-        return None
+    if isinstance(x, str):
+        s = x.strip()
+    else:
+        try:
+            s = str(x).strip()
+        except Exception:  # e.g. str() of a huge int also hits the digit limit
+            return None
+    # Check the digits up front instead of letting int() raise on bad input;
+    # isdecimal() accepts exactly the characters int() does (unlike isdigit()),
+    # and _fits_int() rejects strings longer than int()'s digit limit.
+    digits = s[1:] if s[:1] == "-" else s
+    if digits.isdecimal() and _fits_int(digits):
+        return int(s)
+    return None
+
+def _fits_int(digits: str) -> bool:
+    """
+    True if int() will parse this many digits.
+    Leading zeros count toward Python's limit too, so compare the full length.
+    The limit can never be set below 640, so shorter strings skip the lookup.
+    """
+    if len(digits) <= 640:
+        return True
+    limit = _int_max_str_digits()
+    return not limit or len(digits) <= limit
 
 def _norm_borough(name: str) -> str:
     """
@@ -64,7 +99,7 @@ def _norm_borough(name: str) -> str:
     data don't affect dictionary key matching when grouping or filtering by
     borough name.
     """
-    return str(name).strip().title()
+    return name.strip().title()
 
 def _expand_uhf_code(uhf_code: str) -> List[int]:
     """
@@ -72,19 +107,33 @@ def _expand_uhf_code(uhf_code: str) -> List[int]:
     Example: '105106107' → [105, 106, 107]
     Rationale: UHF34 groups multiple neighborhoods into one region.
     """
-    s = str(uhf_code).strip()
+    s = uhf_code.strip()
     if not s:
         return []
-    # If the string is a long numeric chain divisible by 3, split into 3-digit chunks
-    if s.isdigit() and len(s) > 3 and len(s) % 3 == 0:
-        return [int(s[i:i+3]) for i in range(0, len(s), 3)]
+    # isdecimal() (not isdigit()) matches exactly what int() accepts
+    if s.isdecimal():
+        # If the string is a long numeric chain divisible by 3, split into 3-digit chunks
+        if len(s) > 3 and len(s) % 3 == 0:
+            return [int(s[i:i+3]) for i in range(0, len(s), 3)]
+        # Plain numeric code: already clean, no need for the safe converter
+        if _fits_int(s):
+            return [int(s)]
     v = _to_int_safe(s)
     return [v] if v is not None else []
 
+def _ordered_lists(index: Dict[str, Dict[int, None]]) -> Dict[str, List[int]]:
+    """
+    Turn a dict of ordered sets (dicts with None values) into a dict of lists.
+    The UHF loader dedups with dicts while building, but callers expect lists.
+    """
+    return {k: list(v) for k, v in index.items()}
+
 def _sniff_delimiter(path: Path, default=","):
     """
     Automatically detect CSV delimiter (comma, semicolon, tab, etc.).
     Reason: Some data exports might use different delimiters.
+    Only used when the loaders are asked to sniff, since it costs an extra
+    open/read of the file.
     """
     try:
         with path.open("r", encoding="utf-8-sig") as f:
@@ -97,7 +146,92 @@ def _sniff_delimiter(path: Path, default=","):
 
 # ---------- Loaders (Part 1a and 1b) ----------
 
-def read_pollution():
+def _iter_pollution_csv(delim: str) -> Iterator[Measurement]:
+    """
+    Parse air_quality.csv with csv.reader and yield one measurement per valid row.
+    This is the general path: it understands quoted fields and any delimiter.
+    """
+    with AIR_QUALITY_FILE.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=delim)
+
+        # Peek at the first row instead of loading the whole file into a list
+        first = next(reader, None)
+        if first is None:
+            return
+
+        # Skip header if first cell is not numeric (i.e., 'Geo ID')
+        is_header = bool(first) and not first[0].strip().isdigit()
+        rows = reader if is_header else chain([first], reader)
+
+        for row in rows:
+            if len(row) < 4:
+                continue
+            # IDs follow the same rule as the UHF prompt (_to_int_safe), so a
+            # row is only indexed under an ID a user could type to find it.
+            # float() already ignores surrounding whitespace.
+            uhf_id = _to_int_safe(row[0])
+            if uhf_id is None:
+                continue
+            try:
+                value = float(row[3])
+            except ValueError:
+                continue
+            # Names and dates repeat on every row; intern them so all
+            # measurements share one string object per distinct value.
+            uhf_name = intern(row[1].strip())
+            date_str = intern(row[2].strip())
+
+            # Validate the text fields before adding
+            if not uhf_name or not date_str:
+                continue
+            yield (date_str, uhf_id, uhf_name, value)
+
+def _iter_pollution_mmap() -> Iterator[Measurement]:
+    """
+    Fast path for a plain comma-separated air_quality.csv.
+    Scans the memory-mapped bytes line by line and splits on b',' directly,
+    skipping csv.reader's per-row state machine; float() accepts bytes, so the
+    value column is never decoded. Same rules as the csv path.
+    Files containing quotes or any bare '\r' line ending are handed to
+    _iter_pollution_csv instead.
+    """
+    if AIR_QUALITY_FILE.stat().st_size == 0:
+        return  # mmap cannot map an empty file
+
+    with AIR_QUALITY_FILE.open("rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Quoted fields, or any bare '\r' line ending (old-Mac or mixed files;
+        # readline() only splits on '\n'), need the real csv parser
+        if mm.find(b'"') != -1 or _BARE_CR_SEARCH(mm):
+            yield from _iter_pollution_csv(AIR_QUALITY_DELIM)
+            return
+
+        lines = iter(mm.readline, b"")
+        first = next(lines)
+        if first.startswith(b"\xef\xbb\xbf"):  # UTF-8 BOM, as in utf-8-sig
+            first = first[3:]
+        # Skip header if first cell is not numeric (i.e., 'Geo ID')
+        if first.split(b",", 1)[0].strip().isdigit():
+            lines = chain([first], lines)
+
+        for line in lines:
+            parts = line.split(b",", 4)
+            if len(parts) < 4:
+                continue
+            uhf_id = _to_int_safe(parts[0].decode())  # same ID rule as the csv path
+            if uhf_id is None:
+                continue
+            try:
+                value = float(parts[3])
+            except ValueError:
+                continue
+            uhf_name = intern(parts[1].decode().strip())
+            date_str = intern(parts[2].decode().strip())
+            if not uhf_name or not date_str:
+                continue
+            yield (date_str, uhf_id, uhf_name, value)
+
+def read_pollution(sniff: bool = False):
     """
     Load and index data from air_quality.csv.
 
@@ -106,52 +240,36 @@ def read_pollution():
       2) by_date[date] → list of measurement tuples
 
     This double indexing makes lookups fast for both geography and time.
+    Set sniff=True to auto-detect the delimiter instead of assuming commas.
     """
 
-    # Initialize two lookup dictionaries: one keyed by UHF ID, one by date
-    by_uhf: Dict[int, List[Measurement]] = {}
-    by_date: Dict[str, List[Measurement]] = {}
+    # Initialize two lookup dictionaries: one keyed by UHF ID, one by date.
+    # defaultdict groups rows without allocating a throwaway [] per setdefault.
+    by_uhf: DefaultDict[int, List[Measurement]] = defaultdict(list)
+    by_date: DefaultDict[str, List[Measurement]] = defaultdict(list)
 
     # Verify that the CSV file exists before proceeding
     if not AIR_QUALITY_FILE.exists():
         print(f"Could not find {AIR_QUALITY_FILE}")
-        return by_uhf, by_date
-
-    # Detect delimiter automatically
-    delim = _sniff_delimiter(AIR_QUALITY_FILE, ",")
-    with AIR_QUALITY_FILE.open(newline="", encoding="utf-8-sig") as f:
-        reader = csv.reader(f, delimiter=delim)
-        rows = list(reader)
+        return {}, {}
 
-    if not rows:
-        return by_uhf, by_date
-
-    # Skip header if first cell is not numeric (i.e., 'Geo ID')
-    start_idx = 1 if rows and rows[0] and not str(rows[0][0]).strip().isdigit() else 0
-
-    for row in rows[start_idx:]:
-        if len(row) < 4:
-            continue
-        # Extract and clean each field
-        uhf_id = _to_int_safe(row[0])
-        uhf_name = str(row[1]).strip()
-        date_str = str(row[2]).strip()
-        value = _to_float_safe(row[3])
-
-        # Validate all fields before adding
-        if uhf_id is None or not uhf_name or not date_str or value is None:
-            continue
-        # Create the measurement tuple
-        m: Measurement = (date_str, uhf_id, uhf_name, value)
+    # Comma files go through the byte scanner; a sniffed delimiter needs csv
+    if sniff:
+        delim = _sniff_delimiter(AIR_QUALITY_FILE, AIR_QUALITY_DELIM)
+        measurements = _iter_pollution_csv(delim)
+    else:
+        measurements = _iter_pollution_mmap()
 
+    for m in measurements:
         # Store in both lookup dictionaries
-        by_uhf.setdefault(uhf_id, []).append(m)
-        by_date.setdefault(date_str, []).append(m)
+        by_uhf[m[1]].append(m)
+        by_date[m[0]].append(m)
 
-    return by_uhf, by_date
+    # Hand back plain dicts so missing keys don't silently create entries
+    return dict(by_uhf), dict(by_date)
 
 
-def read_uhf():
+def read_uhf(sniff: bool = False):
     """
     Load and map data from uhf.csv.
 
@@ -164,117 +282,156 @@ def read_uhf():
       The function automatically handles two possible file formats:
         A) With headers containing "borough"/"zip" columns.
         B) Raw format (e.g., 'Bronx,UHF42,101,10463,10471,...')
+      Set sniff=True to auto-detect the delimiter instead of assuming commas.
     """
-    zip_to_uhfs: Dict[str, List[int]] = {}
-    borough_to_uhfs: Dict[str, List[int]] = {}
+    # While building, each value is a dict used as an insertion-ordered set
+    # (O(1) membership instead of scanning a list); converted to lists on return.
+    # defaultdict avoids allocating a throwaway {} on every setdefault call.
+    zip_to_uhfs: DefaultDict[str, Dict[int, None]] = defaultdict(dict)
+    borough_to_uhfs: DefaultDict[str, Dict[int, None]] = defaultdict(dict)
 
     if not UHF_FILE.exists():
         print(f"Could not find {UHF_FILE}")
-        return zip_to_uhfs, borough_to_uhfs
+        return _ordered_lists(zip_to_uhfs), _ordered_lists(borough_to_uhfs)
 
-    # Read and strip whitespace from all cells
-    delim = _sniff_delimiter(UHF_FILE, ",")
+    # Stream rows straight into the indexing loops: strip every cell and skip
+    # blank lines as they are read, without building a list of the whole file
+    delim = _sniff_delimiter(UHF_FILE, UHF_DELIM) if sniff else UHF_DELIM
     with UHF_FILE.open(newline="", encoding="utf-8-sig") as f:
         reader = csv.reader(f, delimiter=delim)
-        rows = [[c.strip() for c in r] for r in reader if any(c.strip() for c in r)]
-
-    if not rows:
-        return zip_to_uhfs, borough_to_uhfs
-
-    # --- Header detection ---
-    # We decide if the file has a header by checking for certain keywords.
-    first_lower = [c.lower() for c in rows[0]]
-    has_header = any(
-        ("borough" in c or "boro" in c or "zip" in c or "uhf_id" in c or "uhf id" in c)
-        for c in first_lower
-    )
-
-    # --- Case A: Header format ---
-    if has_header:
-        header = first_lower
-        data = rows[1:]
-
-        # Helper to find column indices by keyword
-        def find_col(keys, default=None):
-            for i, h in enumerate(header):
-                if any(k in h for k in keys):
-                    return i
-            return default
-
-        i_bor = find_col(["borough", "boro"], 0)
-        i_uhf = find_col(["uhf", "code", "id"], 1)
-        i_zip_start = find_col(["zip"], 2)
-        if i_zip_start is None:
-            i_zip_start = 2
-
-        # Iterate through each row and populate our dictionaries
-        for r in data:
-            if len(r) <= max(i for i in [i_bor, i_uhf, i_zip_start] if i is not None):
+        cleaned = ([c.strip() for c in r] for r in reader)
+        rows = (r for r in cleaned if any(r))
+
+        # Peek at the first non-blank row to detect the format
+        first = next(rows, None)
+        if first is None:
+            return _ordered_lists(zip_to_uhfs), _ordered_lists(borough_to_uhfs)
+
+        # --- Header detection ---
+        # We decide if the file has a header by checking for certain keywords.
+        first_lower = [c.lower() for c in first]
+        has_header = any(
+            ("borough" in c or "boro" in c or "zip" in c or "uhf_id" in c or "uhf id" in c)
+            for c in first_lower
+        )
+
+        # --- Case A: Header format ---
+        if has_header:
+            header = first_lower
+            data = rows  # header row already consumed
+
+            # Helper to find column indices by keyword
+            def find_col(keys, default=None):
+                for i, h in enumerate(header):
+                    if any(k in h for k in keys):
+                        return i
+                return default
+
+            i_bor = find_col(["borough", "boro"], 0)
+            i_uhf = find_col(["uhf", "code", "id"], 1)
+            i_zip_start = find_col(["zip"], 2)
+            if i_zip_start is None:
+                i_zip_start = 2
+
+            # Iterate through each row and populate our dictionaries
+            for r in data:
+                if len(r) <= max(i for i in [i_bor, i_uhf, i_zip_start] if i is not None):
+                    continue
+
+                borough = _norm_borough(r[i_bor]) if i_bor is not None else ""
+                uhf_ids = _expand_uhf_code(r[i_uhf]) if i_uhf is not None else []
+                zip_cells = r[i_zip_start:] if i_zip_start is not None else []
+
+                # Extract valid 5-digit ZIPs only, removing duplicates while preserving order
+                zips = list(dict.fromkeys(m.group() for m in map(_ZIP_MATCH, zip_cells) if m))
+
+                # Map borough → UHF
+                if borough and uhf_ids:
+                    bucket = borough_to_uhfs[borough]
+                    for u in uhf_ids:
+                        bucket[u] = None
+
+                # Map ZIP → UHF
+                for z in zips:
+                    bucket = zip_to_uhfs[z]
+                    for u in uhf_ids:
+                        bucket[u] = None
+
+            return _ordered_lists(zip_to_uhfs), _ordered_lists(borough_to_uhfs)
+
+        # --- Case B: No header (raw format) ---
+        # Example row: Bronx, UHF42, 101, 10463, 10471
+        for r in chain([first], rows):
+            if len(r) < 3:
                 continue
+            borough = _norm_borough(r[0])
+            marker = r[1].upper()  # "UHF42" / "UHF34" indicator (not used directly)
+            code_cell = r[2]       # column 2 = numeric UHF ID(s)
+            uhf_ids = _expand_uhf_code(code_cell)
 
-            borough = _norm_borough(r[i_bor]) if i_bor is not None else ""
-            uhf_ids = _expand_uhf_code(r[i_uhf]) if i_uhf is not None else []
-            zip_cells = r[i_zip_start:] if i_zip_start is not None else []
+            # ZIP codes start from column 3 onward
+            zip_cells = r[3:]
 
-            # Extract valid 5-digit ZIPs only
-            zips = []
-            for z in zip_cells:
-                if len(z) >= 5 and z[:5].isdigit():
-                    zips.append(z[:5])
-            # Remove duplicates while preserving order
-            seen = set()
-            zips = [z for z in zips if not (z in seen or seen.add(z))]
+            # Extract valid 5-digit ZIPs and deduplicate (order-preserving)
+            zips = list(dict.fromkeys(m.group() for m in map(_ZIP_MATCH, zip_cells) if m))
 
-            # Map borough → UHF
+            # Populate borough and ZIP dictionaries
             if borough and uhf_ids:
-                borough_to_uhfs.setdefault(borough, [])
+                bucket = borough_to_uhfs[borough]
                 for u in uhf_ids:
-                    if u not in borough_to_uhfs[borough]:
-                        borough_to_uhfs[borough].append(u)
-
-            # Map ZIP → UHF
+                    bucket[u] = None
             for z in zips:
-                zip_to_uhfs.setdefault(z, [])
+                bucket = zip_to_uhfs[z]
                 for u in uhf_ids:
-                    if u not in zip_to_uhfs[z]:
-                        zip_to_uhfs[z].append(u)
+                    bucket[u] = None
 
-        return zip_to_uhfs, borough_to_uhfs
+        return _ordered_lists(zip_to_uhfs), _ordered_lists(borough_to_uhfs)
 
-    # --- Case B: No header (raw format) ---
-    # Example row: Bronx, UHF42, 101, 10463, 10471
-    for r in rows:
-        if len(r) < 3:
-            continue
-        borough = _norm_borough(r[0])
-        marker = r[1].upper()  # "UHF42" / "UHF34" indicator (not used directly)
-        code_cell = r[2]       # column 2 = numeric UHF ID(s)
-        uhf_ids = _expand_uhf_code(code_cell)
-
-        # ZIP codes start from column 3 onward
-        zip_cells = r[3:]
-
-        # Extract valid 5-digit ZIPs and deduplicate
-        zips = []
-        for z in zip_cells:
-            if len(z) >= 5 and z[:5].isdigit():
-                zips.append(z[:5])
-        seen = set()
-        zips = [z for z in zips if not (z in seen or seen.add(z))]
-
-        # Populate borough and ZIP dictionaries
-        if borough and uhf_ids:
-            borough_to_uhfs.setdefault(borough, [])
-            for u in uhf_ids:
-                if u not in borough_to_uhfs[borough]:
-                    borough_to_uhfs[borough].append(u)
-        for z in zips:
-            zip_to_uhfs.setdefault(z, [])
-            for u in uhf_ids:
-                if u not in zip_to_uhfs[z]:
-                    zip_to_uhfs[z].append(u)
-
-    return zip_to_uhfs, borough_to_uhfs
+
+def _source_signature(sniff: bool):
+    """
+    Identify the current state of both CSV files and of this script (mtime and size).
+    If the data or the parsing code changes, the signature changes and the
+    cache is rebuilt.
+    """
+    sig = []
+    for path in (AIR_QUALITY_FILE, UHF_FILE, Path(__file__)):
+        try:
+            st = path.stat()
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig), sniff
+
+def load_all(sniff: bool = False):
+    """
+    Return (by_uhf, by_date, zip_to_uhfs, borough_to_uhfs).
+
+    Reuses CACHE_FILE when it was built from the same CSV files; otherwise
+    parses both files with read_pollution/read_uhf and refreshes the cache.
+    Unpickling the finished dictionaries is much cheaper than re-parsing.
+    """
+    sig = _source_signature(sniff)
+    try:
+        with CACHE_FILE.open("rb") as f:
+            cached_sig, data = pickle.load(f)
+        if cached_sig == sig:
+            return data
+    except Exception:
+        pass  # Missing, unreadable, or stale cache: just rebuild it
+
+    by_uhf, by_date = read_pollution(sniff=sniff)
+    zip_to_uhfs, borough_to_uhfs = read_uhf(sniff=sniff)
+    data = (by_uhf, by_date, zip_to_uhfs, borough_to_uhfs)
+
+    # Only cache complete loads, and never fail just because we can't write
+    if by_uhf and zip_to_uhfs:
+        try:
+            with CACHE_FILE.open("wb") as f:
+                pickle.dump((sig, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return data
 
 
 # ---------- Query Helpers (Part 1c) ----------
@@ -295,9 +452,10 @@ def search_by_zip(zip_code: str, zip_to_uhfs, by_uhf) -> List[Measurement]:
     return out
 
 def search_by_uhf(uhf_id, by_uhf) -> List[Measurement]:
-    """Return all measurements for a specific UHF ID."""
+    """Return all measurements for a specific UHF ID.
+    The list is by_uhf's own bucket (no copy), so treat it as read-only."""
     u = _to_int_safe(uhf_id)
-    return list(by_uhf.get(u, [])) if u is not None else []
+    return by_uhf.get(u, []) if u is not None else []
 
 def search_by_borough(borough: str, borough_to_uhfs, by_uhf) -> List[Measurement]:
     """
@@ -311,21 +469,34 @@ def search_by_borough(borough: str, borough_to_uhfs, by_uhf) -> List[Measurement
     return out
 
 def search_by_date(date_str: str, by_date) -> List[Measurement]:
-    """Return all measurements recorded on a specific date."""
-    return list(by_date.get(date_str.strip(), []))
+    """Return all measurements recorded on a specific date.
+    The list is by_date's own bucket (no copy), so treat it as read-only."""
+    return by_date.get(date_str.strip(), [])
 
 
 # ---------- CLI (Main interactive interface) ----------
 
-def main():
+def main(argv=None):
     """
     Main entry point for the program
     Loads data once at startup, then repeatedly asks user for search criteria.
     This command-line interface allows flexible exploration of the dataset.
+    argv is the list of CLI options (e.g. ["--sniff"]); when omitted, sys.argv
+    is only read if this file is run as a script, so calling main() from a
+    notebook ignores the kernel's own arguments.
     """
+    parser = argparse.ArgumentParser(description="Query NYC air quality data.")
+    parser.add_argument(
+        "--sniff",
+        action="store_true",
+        help="auto-detect the CSV delimiter instead of assuming commas",
+    )
+    if argv is None:
+        argv = sys.argv[1:] if __name__ == "__main__" else []
+    args = parser.parse_args(argv)
+
     print("Loading data...")
-    by_uhf, by_date = read_pollution()
-    zip_to_uhfs, borough_to_uhfs = read_uhf()
+    by_uhf, by_date, zip_to_uhfs, borough_to_uhfs = load_all(sniff=args.sniff)
     total = sum(len(v) for v in by_uhf.values())
     print("Loaded.")
     print(
@@ -343,6 +514,10 @@ def main():
         "  q) quit\n"
     )
 
+    # Results of earlier queries, keyed by (search type, term), so typing the
+    # same query again is a dict lookup instead of a fresh search
+    results_cache: Dict[Tuple[str, str], List[Measurement]] = {}
+
   #Keep prompting user until they quit
     while True:
         print(menu)
@@ -354,27 +529,35 @@ def main():
         # Each option uses the search functions we defined earlier
         if choice in ("1", "zip"):
             term = input("Enter 5-digit zip: ").strip()
-            results = search_by_zip(term, zip_to_uhfs, by_uhf)
+            key = ("zip", term)
+            if key not in results_cache:
+                results_cache[key] = search_by_zip(term, zip_to_uhfs, by_uhf)
         elif choice in ("2", "uhf"):
             term = input("Enter UHF id: ").strip()
-            results = search_by_uhf(term, by_uhf)
+            key = ("uhf", term)
+            if key not in results_cache:
+                results_cache[key] = search_by_uhf(term, by_uhf)
         elif choice in ("3", "borough"):
             term = input("Enter borough name: ").strip()
-            results = search_by_borough(term, borough_to_uhfs, by_uhf)
+            key = ("borough", term)
+            if key not in results_cache:
+                results_cache[key] = search_by_borough(term, borough_to_uhfs, by_uhf)
         elif choice in ("4", "date"):
             term = input("Enter date as YYYY/MM/DD: ").strip()
-            results = search_by_date(term, by_date)
+            key = ("date", term)
+            if key not in results_cache:
+                results_cache[key] = search_by_date(term, by_date)
         else:
             print("Invalid choice.\n")
             continue
+        results = results_cache[key]
 
         if not results:
             print("No matching records.\n")
             continue
 
-        # Print all results neatly formatted
-        for m in results:
-            print(_format_measurement(m))
+        # Print all results neatly formatted, as one write instead of one per row
+        print("\n".join(map(_format_measurement, results)))
         print(f"\nReturned {len(results)} measurements.\n")
 
 